@@ -1,17 +1,24 @@
 import cv2
+import numpy as np
 import mediapipe as mp
 import mediapipe.tasks as mp_tasks
 from mediapipe.tasks.python import vision
 import time
+import threading
 from dataclasses import dataclass
 from typing import List, Dict, Tuple
 import platform
-import csv
 import os
 from datetime import datetime
 
 from abc import ABC, abstractmethod
 
+# Optional: Numba JIT for the per-frame finger state kernel
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # --- Configuration & Constants ---
 # MediaPipe Landmark Indices
 # Thumb: 4, Index: 8, Middle: 12, Ring: 16, Pinky: 20
@@ -20,6 +27,21 @@ FINGER_TIPS = [4, 8, 12, 16, 20]
 FINGER_MCP = [2, 5, 9, 13, 17] # Knuckles (Metacarpophalangeal joints)
 FINGER_NAMES = ["Thumb", "Index", "Middle", "Ring", "Pinky"]
 
+# Hoisted out of the per-frame path
+_MP_SRGB = mp.ImageFormat.SRGB
+_MP_IMAGE = mp.Image
+
+def landmarks_to_array(landmarks):
+    """
+    Convert a list of 21 NormalizedLandmark objects into a (21, 3) float32
+    array of (x, y, z). Done once per frame so drawing, detection and
+    logging all share the same array instead of re-reading attributes.
+    """
+    return np.fromiter(
+        (v for lm in landmarks for v in (lm.x, lm.y, lm.z)),
+        dtype=np.float32, count=63
+    ).reshape(21, 3)
+
 def get_device_delegate():
     os_name = platform.system()
     
@@ -39,58 +61,77 @@ class KeyPressEvent:
     start_time: float
     duration: float
 
-@dataclass
-class FingerState:
+def _finger_step(pressed_now, is_pressed, press_starts, released, durations, now):
     """
-    Tracks the state of a single finger to calculate duration.
-    State Machine: IDLE -> PRESSED -> RELEASED -> IDLE
+    Advance all 5 finger state machines (IDLE -> PRESSED -> RELEASED -> IDLE)
+    in one call. Mutates `is_pressed` and `press_starts` in place and fills
+    the caller-owned `released` mask and `durations` arrays, so the per-frame
+    call allocates nothing.
+
+    Compiled with Numba when available; the same code runs as plain
+    Python/NumPy otherwise.
     """
-    name: str
-    is_pressed: bool = False
-    press_start_time: float = 0.0
-        
-    def update(self, pressed_now: bool) -> KeyPressEvent:
-        event = None
-        
-        if pressed_now and not self.is_pressed:
+    for i in range(5):
+        released[i] = False
+        durations[i] = 0.0
+        if pressed_now[i] and not is_pressed[i]:
             # Transition: IDLE -> PRESSED
-            self.is_pressed = True
-            self.press_start_time = time.time()
-            # print(f"[{self.name}] Down") # Debug logging
-            
-        elif not pressed_now and self.is_pressed:
+            is_pressed[i] = True
+            press_starts[i] = now
+        elif not pressed_now[i] and is_pressed[i]:
             # Transition: PRESSED -> RELEASED
-            self.is_pressed = False
-            duration = time.time() - self.press_start_time
-            event = KeyPressEvent(self.name, self.press_start_time, duration)
-            print(f"[{self.name}] Released. Duration: {duration:.2f}s")
-            
-        return event
+            is_pressed[i] = False
+            released[i] = True
+            durations[i] = now - press_starts[i]
+
+if njit is not None:
+    _finger_step = njit(cache=True)(_finger_step)
 
 class AbstractFingerDetector(ABC):
     @abstractmethod
     def detect(self, landmarks, frame_shape) -> List[bool]:
         """
         Determines if each of the 5 fingers is pressed.
+        `landmarks` is a (21, 3) float32 array of normalized (x, y, z).
         Returns a list of 5 booleans [Thumb, Index, Middle, Ring, Pinky].
         """
         pass
 
+def _make_press_kernel(tips, mcp, offset):
+    """
+    Build the tip-vs-knuckle comparison with the finger indices and press
+    threshold bound as closure constants. Numba treats closure variables as
+    compile-time literals, so the JITed kernel gets them constant-folded
+    instead of re-reading Python attributes every frame.
+    """
+    @njit(cache=False)
+    def kernel(arr):
+        out = np.empty(5, np.bool_)
+        for i in range(5):
+            out[i] = arr[tips[i], 1] > arr[mcp[i], 1] + offset
+        return out
+    return kernel
+
 class HeuristicFingerDetector(AbstractFingerDetector):
+    # Simple Heuristic: If Tip Y > Knuckle Y (plus offset), it's curled/pressed.
+    PRESS_Y_OFFSET = 0.02
+
+    def __init__(self):
+        self._tips = np.array(FINGER_TIPS)
+        self._mcp = np.array(FINGER_MCP)
+        # Specialized JIT kernel when Numba is present; warmed up here so
+        # compilation doesn't land on the first frame
+        self._kernel = None
+        if njit is not None:
+            self._kernel = _make_press_kernel(self._tips, self._mcp, self.PRESS_Y_OFFSET)
+            self._kernel(np.zeros((21, 3), dtype=np.float32))
+
     def detect(self, landmarks, frame_shape) -> List[bool]:
-        is_pressed_list = []
-        for i in range(5):
-            tip_idx = FINGER_TIPS[i]
-            mcp_idx = FINGER_MCP[i]
-            
-            # Note: landmarks is now a list of NormalizedLandmark objects
-            tip_y = landmarks[tip_idx].y
-            mcp_y = landmarks[mcp_idx].y
-            
-            # Simple Heuristic: If Tip Y > Knuckle Y (plus offset), it's curled/pressed.
-            is_down = tip_y > (mcp_y + 0.02)
-            is_pressed_list.append(is_down)
-        return is_pressed_list
+        # One call/comparison for all 5 fingers; the returned ndarray
+        # iterates like a list of booleans for callers.
+        if self._kernel is not None:
+            return self._kernel(landmarks)
+        return landmarks[self._tips, 1] > (landmarks[self._mcp, 1] + self.PRESS_Y_OFFSET)
 
 class TrainedFingerDetector(AbstractFingerDetector):
     def __init__(self, model_path: str = None):
@@ -120,57 +161,114 @@ class TrainedFingerDetector(AbstractFingerDetector):
         pass
 
 class LandmarkLogger:
+    """
+    Logs per-frame landmarks and press labels to a binary .npy file.
+
+    Rows are buffered in a preallocated float32 array and flushed to disk in
+    chunks, so the per-frame cost is a single row copy — no float->string
+    formatting or per-row writes like the old CSV sink. The .npy header is
+    patched with the final row count at close, so the file loads with a
+    plain np.load. Column names go to a .columns.txt sidecar.
+
+    Timestamps are stored relative to logger creation to stay within
+    float32 millisecond precision.
+    """
+    CHUNK_ROWS = 1024
+    # timestamp + 21*3 landmarks + 5*2 tip/mcp y + 5 labels
+    NUM_COLS = 1 + 63 + 10 + 5
+
     def __init__(self, output_dir="training_data"):
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
-        
+
         # Create unique filename based on timestamp
         timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.filepath = os.path.join(output_dir, f"landmarks_{timestamp_str}.csv")
-        
-        self.file = open(self.filepath, 'w', newline='')
-        self.writer = csv.writer(self.file)
-        
-        # Write Header
+        self.filepath = os.path.join(output_dir, f"landmarks_{timestamp_str}.npy")
+
+        # Column schema
         # timestamp, [x0, y0, z0, ...], [Thumb_tip_y, Thumb_mcp_y, ...], [Thumb_pressed, ...]
         header = ["timestamp_ms"]
         for i in range(21):
             header.extend([f"lm_{i}_x", f"lm_{i}_y", f"lm_{i}_z"])
-            
+
         # Add specific features for easy analysis
         for name in FINGER_NAMES:
             header.extend([f"{name}_tip_y", f"{name}_mcp_y"])
-            
+
         for name in FINGER_NAMES:
             header.append(f"{name}_pressed")
-            
-        self.writer.writerow(header)
+
+        with open(self.filepath.replace('.npy', '.columns.txt'), 'w') as f:
+            f.write('\n'.join(header) + '\n')
+
+        self.file = open(self.filepath, 'wb')
+        self._write_npy_header(0)
+
+        self._buf = np.empty((self.CHUNK_ROWS, self.NUM_COLS), dtype=np.float32)
+        self._buf_rows = 0
+        self._total_rows = 0
+        self._t0_ms = None
         print(f"Logging training data to: {self.filepath}")
 
+    def _write_npy_header(self, rows):
+        # The padded v1.0 header has a fixed 128-byte size for this dtype and
+        # any realistic row count, so it can be rewritten in place at close
+        self.file.seek(0)
+        np.lib.format.write_array_header_1_0(self.file, {
+            'descr': '<f4', 'fortran_order': False,
+            'shape': (rows, self.NUM_COLS),
+        })
+
     def log(self, timestamp_ms, landmarks, pressed_states):
-        row = [timestamp_ms]
-        
-        # Add all landmarks
-        for lm in landmarks:
-            row.extend([lm.x, lm.y, lm.z])
-            
-        # Add specific tip and mcp y values
-        for i in range(5):
-            tip_idx = FINGER_TIPS[i]
-            mcp_idx = FINGER_MCP[i]
-            row.extend([landmarks[tip_idx].y, landmarks[mcp_idx].y])
-            
-        # Add pressed/not pressed labels (0 or 1)
-        row.extend([1 if p else 0 for p in pressed_states])
-        
-        self.writer.writerow(row)
+        # `landmarks` is the shared (21, 3) float32 array built once per frame
+        if self._t0_ms is None:
+            self._t0_ms = timestamp_ms
+
+        row = self._buf[self._buf_rows]
+        row[0] = timestamp_ms - self._t0_ms
+        row[1:64] = landmarks.ravel()
+        # Interleaved tip/mcp y pairs, matching the column schema
+        row[64:74:2] = landmarks[FINGER_TIPS, 1]
+        row[65:74:2] = landmarks[FINGER_MCP, 1]
+        row[74:79] = pressed_states
+
+        self._buf_rows += 1
+        if self._buf_rows == self.CHUNK_ROWS:
+            self._flush()
+
+    def _flush(self):
+        if self._buf_rows:
+            self._buf[:self._buf_rows].tofile(self.file)
+            self._total_rows += self._buf_rows
+            self._buf_rows = 0
 
     def close(self):
         if self.file:
+            self._flush()
+            self._write_npy_header(self._total_rows)
             self.file.close()
+            self.file = None
 
 class HandProcessor:
-    def __init__(self, model_path='hand_landmarker.task', detector: AbstractFingerDetector = None, log_data: bool = False):
+    # Default width the frame is downscaled to before inference. The
+    # landmarker runs at a fixed internal resolution anyway, so feeding it
+    # the full camera frame only inflates color-convert and upload cost.
+    DEFAULT_INFER_WIDTH = 640
+
+    # After this many consecutive frames without a hand, drop to running
+    # detection only every IDLE_DETECT_STRIDE-th frame. The first frame with
+    # a hand resets to every-frame detection.
+    NO_HAND_IDLE_FRAMES = 15
+    IDLE_DETECT_STRIDE = 4
+
+    # While the last result tracked a hand with at least this handedness
+    # score, reuse it for up to TRACK_SKIP_FRAMES frames before invoking the
+    # landmarker again (VIDEO mode only).
+    TRACK_CONFIDENCE = 0.8
+    TRACK_SKIP_FRAMES = 1
+
+    def __init__(self, model_path='hand_landmarker.task', detector: AbstractFingerDetector = None, log_data: bool = False,
+                 live_stream: bool = False, infer_width: int = None):
         # Initialize MediaPipe Tasks HandLandmarker with GPU delegate
         try:
             with open(model_path, 'r'): pass
@@ -179,88 +277,303 @@ class HandProcessor:
             # Assuming widely available task file or user provided path.
             print(f"Warning: Model file '{model_path}' not found at init.")
 
+        # LIVE_STREAM runs the landmarker asynchronously so capture/encode
+        # overlap inference; results arrive via callback one frame late.
+        # VIDEO mode stays the default for deterministic file processing.
+        self.live_stream = live_stream
+        self.infer_width = infer_width or self.DEFAULT_INFER_WIDTH
+        self._result_lock = threading.Lock()
+        self._latest_result = None
+        self._latest_result_ts = -1
+
+        # Prefer the platform delegate, but fall back to CPU at runtime: the
+        # GPU delegate needs EGL/GLES support in the mediapipe build and the
+        # driver stack (see deploy/Dockerfile.x86), and rejects creation
+        # otherwise — without the fallback those hosts would not start at all.
+        delegate = get_device_delegate()
+        try:
+            self.landmarker = self._create_landmarker(model_path, delegate)
+        except Exception as e:
+            if delegate == mp.tasks.BaseOptions.Delegate.GPU:
+                print(f"GPU delegate unavailable ({e}), falling back to CPU.")
+                self.landmarker = self._create_landmarker(
+                    model_path, mp.tasks.BaseOptions.Delegate.CPU)
+            else:
+                raise
+
+        # Set detector strategy
+        self.detector = detector if detector else HeuristicFingerDetector()
+
+        # Initialize Logger
+        self.logger = LandmarkLogger() if log_data else None
+
+        # Reusable downscale and RGB buffers for the inference frame;
+        # allocated lazily once the inference size is known, so resize and
+        # cvtColor write in place instead of allocating fresh arrays every
+        # frame
+        self._small_buf = None
+        self._rgb_buf = None
+
+        # Route resize + color convert through OpenCV's T-API (OpenCL) when a
+        # device is present, offloading the pixel passes to the iGPU/dGPU.
+        # Ops transparently run on CPU when OpenCL is unavailable.
+        self._use_opencl = cv2.ocl.haveOpenCL()
+        if self._use_opencl:
+            print("OpenCL available: preprocessing via cv2.UMat")
+
+        # Skeleton topology as an index array, so drawing can be batched
+        self._connections = np.array(list(mp.solutions.hands.HAND_CONNECTIONS), dtype=np.int32)
+
+        # Precomputed disc masks, stamped onto the frame with plain numpy
+        # writes: one masked assignment per point instead of one cv2.circle
+        # Python->C crossing per point
+        self._joint_mask = self._disc_mask(5)
+        self._tip_mask = self._disc_mask(10)
+
+        # Finger press state as parallel arrays, advanced by _finger_step;
+        # released/durations are reused output arrays so the per-frame call
+        # is allocation-free
+        self._is_pressed = np.zeros(5, dtype=np.bool_)
+        self._press_starts = np.zeros(5, dtype=np.float64)
+        self._released = np.zeros(5, dtype=np.bool_)
+        self._durations = np.zeros(5, dtype=np.float64)
+        # Warm up the JIT so compilation doesn't land on the first frame
+        _finger_step(np.zeros(5, dtype=np.bool_),
+                     self._is_pressed.copy(), self._press_starts.copy(),
+                     self._released, self._durations, 0.0)
+
+        # Reduced-cadence detection while no hand is in view
+        self._no_hand_streak = 0
+        self._idle_phase = 0
+
+        # Confident-tracking cadence (VIDEO mode)
+        self._last_result = None
+        self._track_skip_left = 0
+
+        # Cached (w, h) pixel scale vector; rebuilt only when the frame size
+        # changes instead of allocated per frame
+        self._wh = None
+        self._px_scale = None
+
+    def _create_landmarker(self, model_path, delegate):
         base_options = mp_tasks.BaseOptions(
             model_asset_path=model_path,
-            delegate=get_device_delegate()
+            delegate=delegate
         )
-        options = vision.HandLandmarkerOptions(
+        common_options = dict(
             base_options=base_options,
-            running_mode=vision.RunningMode.VIDEO,
             num_hands=1,
             min_hand_detection_confidence=0.7,
             min_hand_presence_confidence=0.5,
             min_tracking_confidence=0.5
         )
-        self.landmarker = vision.HandLandmarker.create_from_options(options)
-        
-        # Initialize state trackers for 5 fingers
-        self.finger_states = [FingerState(name) for name in FINGER_NAMES]
-        
-        # Set detector strategy
-        self.detector = detector if detector else HeuristicFingerDetector()
-        
-        # Initialize Logger
-        self.logger = LandmarkLogger() if log_data else None
+        if self.live_stream:
+            options = vision.HandLandmarkerOptions(
+                running_mode=vision.RunningMode.LIVE_STREAM,
+                result_callback=self._on_result,
+                **common_options
+            )
+        else:
+            options = vision.HandLandmarkerOptions(
+                running_mode=vision.RunningMode.VIDEO,
+                **common_options
+            )
+        return vision.HandLandmarker.create_from_options(options)
+
+    def _run_inference(self, frame, w, h, timestamp_ms):
+        """Preprocess `frame` and invoke the landmarker, returning a result
+        (possibly the latest async one in LIVE_STREAM mode, possibly None)."""
+        # Downscale before inference; landmarks are normalized [0,1] so they
+        # map back onto the full-resolution frame for drawing unchanged.
+        downscale = w > self.infer_width
+        if downscale:
+            infer_size = (self.infer_width, int(h * self.infer_width / w))
+
+        # 4-channel frames are BGRx from the Jetson pipeline; the single
+        # cvtColor below drops the padding channel for free, so no separate
+        # BGRx->BGR pass is ever needed on the capture path.
+        channels = frame.shape[2]
+        cvt_code = cv2.COLOR_BGRA2RGB if channels == 4 else cv2.COLOR_BGR2RGB
+
+        if self._use_opencl:
+            # UMat keeps resize + cvtColor on the OpenCL device; only the
+            # small RGB result is downloaded back to host memory
+            umat = cv2.UMat(frame)
+            if downscale:
+                umat = cv2.resize(umat, infer_size, interpolation=cv2.INTER_AREA)
+            rgb = cv2.cvtColor(umat, cvt_code).get()
+        else:
+            if downscale:
+                small_shape = (infer_size[1], infer_size[0], channels)
+                if self._small_buf is None or self._small_buf.shape != small_shape:
+                    self._small_buf = np.empty(small_shape, dtype=frame.dtype)
+                infer_frame = cv2.resize(frame, infer_size, dst=self._small_buf,
+                                         interpolation=cv2.INTER_AREA)
+            else:
+                infer_frame = frame
+            # Convert on the (small) inference frame into a persistent buffer:
+            # one memory pass over ~1/9th the pixels, no per-frame allocation
+            rgb_shape = infer_frame.shape[:2] + (3,)
+            if self._rgb_buf is None or self._rgb_buf.shape != rgb_shape:
+                self._rgb_buf = np.empty(rgb_shape, dtype=frame.dtype)
+            cv2.cvtColor(infer_frame, cvt_code, dst=self._rgb_buf)
+            rgb = self._rgb_buf
+
+        # MediaPipe Tasks requires mp.Image. The wrapper itself is cheap and
+        # must be rebuilt per frame — the SDK copies pixel data into its own
+        # storage at construction, so caching the wrapper would freeze the
+        # first frame. The heavy allocation (the RGB backing array) is the
+        # persistent buffer above.
+        mp_image = _MP_IMAGE(image_format=_MP_SRGB, data=rgb)
+
+        if self.live_stream:
+            # Non-blocking: kick off inference and render with the most
+            # recent completed result (typically one frame behind)
+            self.landmarker.detect_async(mp_image, timestamp_ms)
+            with self._result_lock:
+                return self._latest_result
 
-    def process(self, frame):
-        # MediaPipe Tasks requires mp.Image
-        img_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=img_rgb)
-        
-        # Timestamp in ms (must be increasing)
-        timestamp_ms = int(time.time() * 1000)
-        
         result = self.landmarker.detect_for_video(mp_image, timestamp_ms)
-        
+        self._last_result = result
+
+        # Schedule reuse of this result while tracking looks solid
+        confidence = 0.0
+        if result.hand_landmarks and result.handedness:
+            confidence = result.handedness[0][0].score
+        self._track_skip_left = (
+            self.TRACK_SKIP_FRAMES if confidence >= self.TRACK_CONFIDENCE else 0)
+
+        return result
+
+    def process(self, frame):
+        # While the scene has been hand-free for a while, skip preprocessing
+        # and inference entirely on most frames; detection still runs at a
+        # reduced cadence so a reappearing hand is picked up within a few
+        # frames, which resets to every-frame detection.
+        if self._no_hand_streak >= self.NO_HAND_IDLE_FRAMES:
+            self._idle_phase = (self._idle_phase + 1) % self.IDLE_DETECT_STRIDE
+            if self._idle_phase != 0:
+                return frame, []
+
+        # One monotonic clock read per frame, shared by the MediaPipe
+        # timestamp and all finger state machines. Monotonic also guarantees
+        # the increasing-timestamp contract (wall clock can step backwards).
+        now_ns = time.monotonic_ns()
+        now = now_ns / 1e9
+        timestamp_ms = now_ns // 1_000_000
+
+        h, w = frame.shape[:2]
+        if self._wh != (w, h):
+            self._wh = (w, h)
+            self._px_scale = np.array([w, h], dtype=np.float32)
+
+        # Two-tier cadence (VIDEO mode): while tracking is confident, reuse
+        # the previous landmarks for up to TRACK_SKIP_FRAMES frames and skip
+        # the landmarker call entirely — mirroring MediaPipe's own
+        # detect-once / track-many flow control. State machines still advance
+        # every frame with the current timestamp.
+        if not self.live_stream and self._track_skip_left > 0 and self._last_result is not None:
+            self._track_skip_left -= 1
+            result = self._last_result
+        else:
+            result = self._run_inference(frame, w, h, timestamp_ms)
+
+        if result is not None and result.hand_landmarks:
+            self._no_hand_streak = 0
+        else:
+            self._no_hand_streak += 1
+
         events = []
-        
-        if result.hand_landmarks:
+
+        if result is not None and result.hand_landmarks:
             for hand_lms in result.hand_landmarks:
+                # Convert to a (21, 3) array once; drawing, detection and
+                # logging all work off the same array
+                lm_arr = landmarks_to_array(hand_lms)
+
+                # Pixel coordinates computed once, shared by the skeleton
+                # and the fingertip markers below
+                px = (lm_arr[:, :2] * self._px_scale).astype(np.int32)
+
                 # 1. Draw the skeleton
-                self._draw_skeleton(frame, hand_lms)
-                
+                self._draw_skeleton(frame, px)
+
                 # 2. Analyze geometric logic
                 # Get detection results from the strategy
-                pressed_states = self.detector.detect(hand_lms, frame.shape)
-                
+                pressed_states = self.detector.detect(lm_arr, frame.shape)
+
                 # Log data for training
                 if self.logger:
-                    self.logger.log(timestamp_ms, hand_lms, pressed_states)
-                
-                # Update state machines and visualize
-                h, w, _ = frame.shape
-                for i, is_down in enumerate(pressed_states):
-                    # Update State Machine
-                    event = self.finger_states[i].update(is_down)
-                    if event:
-                        events.append(event)
-                        
-                    # Visual Feedback on frame
-                    color = (0, 255, 0) if is_down else (0, 0, 255)
-                    # Convert normalized to pixel coords for drawing
-                    tip_idx = FINGER_TIPS[i]
-                    cx, cy = int(hand_lms[tip_idx].x * w), int(hand_lms[tip_idx].y * h)
-                    cv2.circle(frame, (cx, cy), 10, color, cv2.FILLED)
-                
+                    self.logger.log(timestamp_ms, lm_arr, pressed_states)
+
+                # Advance all 5 state machines in one (JIT-compiled) call
+                pressed_arr = np.asarray(pressed_states, dtype=np.bool_)
+                released, durations = self._released, self._durations
+                _finger_step(pressed_arr, self._is_pressed, self._press_starts,
+                             released, durations, now)
+
+                for i in range(5):
+                    if released[i]:
+                        duration = durations[i]
+                        events.append(KeyPressEvent(FINGER_NAMES[i], now - duration, duration))
+                        print(f"[{FINGER_NAMES[i]}] Released. Duration: {duration:.2f}s")
+
+                # Visual feedback, reusing the shared pixel coords: all five
+                # fingertip markers land in two masked stamps (pressed green,
+                # idle red) instead of five cv2.circle calls
+                tip_px = px[FINGER_TIPS]
+                self._stamp_discs(frame, tip_px[pressed_arr], self._tip_mask, (0, 255, 0))
+                self._stamp_discs(frame, tip_px[~pressed_arr], self._tip_mask, (0, 0, 255))
+
         return frame, events
 
+    def _on_result(self, result, output_image, timestamp_ms):
+        # Called from MediaPipe's worker thread in LIVE_STREAM mode. Keep
+        # only the newest result: callbacks are not guaranteed to arrive in
+        # submission order, so an older in-flight result must never replace
+        # a newer one.
+        with self._result_lock:
+            if timestamp_ms > self._latest_result_ts:
+                self._latest_result = result
+                self._latest_result_ts = timestamp_ms
+
     def close(self):
         if self.logger:
             self.logger.close()
 
-    def _draw_skeleton(self, frame, landmarks):
-        h, w, _ = frame.shape
-        # Draw connections
-        for start_idx, end_idx in mp.solutions.hands.HAND_CONNECTIONS:
-            start = landmarks[start_idx]
-            end = landmarks[end_idx]
-            cv2.line(frame, 
-                     (int(start.x * w), int(start.y * h)), 
-                     (int(end.x * w), int(end.y * h)), 
-                     (255, 255, 255), 2)
-        
+    def _draw_skeleton(self, frame, px):
+        # `px` is the (21, 2) int32 pixel-coordinate array computed once per
+        # frame in process(); (N, 2, 2) array of segment endpoints, drawn as
+        # open polylines in a single call — no per-segment Python list needed
+        segments = px[self._connections].reshape(-1, 2, 2)
+        cv2.polylines(frame, segments, isClosed=False, color=(255, 255, 255), thickness=2)
+
         # Draw points
-        for lm in landmarks:
-             cx, cy = int(lm.x * w), int(lm.y * h)
-             cv2.circle(frame, (cx, cy), 5, (0, 0, 255), cv2.FILLED)
+        self._stamp_discs(frame, px, self._joint_mask, (0, 0, 255))
+
+    @staticmethod
+    def _disc_mask(radius):
+        yy, xx = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+        return xx * xx + yy * yy <= radius * radius
+
+    @staticmethod
+    def _stamp_discs(frame, centers, mask, color):
+        """
+        Stamp a precomputed boolean disc mask at each (x, y) in `centers`,
+        clipped at the frame borders. Each point costs one masked numpy
+        assignment — noticeably cheaper than a filled cv2.circle per point
+        for these small, fixed radii.
+        """
+        mh, mw = mask.shape
+        r = mh // 2
+        h, w = frame.shape[:2]
+        # Pad the color for 4-channel (BGRx) frames
+        color = np.asarray(color + (0,) * (frame.shape[2] - 3), dtype=frame.dtype)
+        for cx, cy in centers:
+            y0, y1 = cy - r, cy + r + 1
+            x0, x1 = cx - r, cx + r + 1
+            m = mask[max(0, -y0):mh - max(0, y1 - h),
+                     max(0, -x0):mw - max(0, x1 - w)]
+            if m.size:
+                frame[max(0, y0):y1, max(0, x0):x1][m] = color
 
@@ -1,6 +1,8 @@
 import cv2
 import os
 import argparse
+import queue
+import threading
 
 # --- Argument Parsing ---
 parser = argparse.ArgumentParser(description="Extract frames from a video as JPEGs.")
@@ -12,18 +14,51 @@ args = parser.parse_args()
 os.makedirs(args.output_dir, exist_ok=True)
 
 # --- Video Processing ---
+# Decode on a reader thread while a pool of workers encodes JPEGs in
+# parallel: cv2.imwrite releases the GIL, so encoding scales across cores
+# instead of serializing behind the decode loop. Workers consume the
+# bounded queue directly, so decoded-but-unwritten frames can never
+# exceed the queue capacity when encoding is the slower side.
 cap = cv2.VideoCapture(args.video_path)
+frame_queue = queue.Queue(maxsize=64)
+_SENTINEL = object()
+NUM_WORKERS = os.cpu_count() or 4
+
 frame_count = 0
 
-while True:
-    ret, frame = cap.read()
-    if not ret:
-        break
+def read_frames():
+    global frame_count
+    idx = 0
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frame_queue.put((idx, frame))
+        idx += 1
+    frame_count = idx
+    # One sentinel per worker so every thread sees shutdown
+    for _ in range(NUM_WORKERS):
+        frame_queue.put(_SENTINEL)
+
+def write_frames():
+    while True:
+        item = frame_queue.get()
+        if item is _SENTINEL:
+            break
+        idx, frame = item
+        filename = os.path.join(args.output_dir, f"frame_{idx:04d}.jpg")
+        cv2.imwrite(filename, frame)
 
-    filename = os.path.join(args.output_dir, f"frame_{frame_count:04d}.jpg")
-    cv2.imwrite(filename, frame)
-    frame_count += 1
+reader = threading.Thread(target=read_frames, daemon=True)
+reader.start()
 
+workers = [threading.Thread(target=write_frames, daemon=True)
+           for _ in range(NUM_WORKERS)]
+for worker in workers:
+    worker.start()
+
+reader.join()
+for worker in workers:
+    worker.join()
 cap.release()
 print(f"Extracted {frame_count} frames to {args.output_dir}/")
-
@@ -3,22 +3,45 @@ from .video_source import VideoSource
 import time
 
 class LiveCameraSource(VideoSource):
+    # Max buffered frames discarded per iteration while draining to the
+    # newest capture, and the grab() latency above which a frame is
+    # considered freshly captured rather than served from the buffer.
+    MAX_DRAIN = 8
+    FRESH_GRAB_SEC = 0.002
+
     def __init__(self, camera_index=0):
         self.cap = None
         self.camera_idx = camera_index
-        
+
         self._fps = None
+        self._dropped = 0
 
     def _connect(self):
         try:
             self.cap = cv2.VideoCapture(self.camera_idx)
-            # Force MJPG and 1080p again
-            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('M', 'J', 'P', 'G'))
+            mjpg = cv2.VideoWriter_fourcc('M', 'J', 'P', 'G')
+            # Property order matters on V4L2: fourcc, then resolution, then
+            # fps — so the driver negotiates MJPG at the requested mode
+            # instead of uncompressed YUYV, which saturates USB2 bandwidth
+            # at 1080p and forces the camera down to a few fps.
+            self.cap.set(cv2.CAP_PROP_FOURCC, mjpg)
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1920)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 1080)
-            self.cap.set(cv2.CAP_PROP_AUTO_EXPOSURE, 0.25) 
+            self.cap.set(cv2.CAP_PROP_FPS, 30)
+            # Keep the driver queue at one frame so staleness stays bounded
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            self.cap.set(cv2.CAP_PROP_AUTO_EXPOSURE, 0.25)
             self.cap.set(cv2.CAP_PROP_EXPOSURE, -5.0)
 
+            # Verify MJPG actually stuck; if the camera refused it at 1080p,
+            # retry at 720p where virtually all UVC cameras offer MJPG
+            if int(self.cap.get(cv2.CAP_PROP_FOURCC)) != mjpg:
+                print("Camera refused MJPG at 1080p, falling back to 720p")
+                self.cap.set(cv2.CAP_PROP_FOURCC, mjpg)
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+                self.cap.set(cv2.CAP_PROP_FPS, 30)
+
             if self.cap.isOpened():
                 print(f"Successfully connected to camera {self.camera_idx}")
             else:
@@ -40,9 +63,11 @@ class LiveCameraSource(VideoSource):
                 self._connect()            
 
             if self.cap and self.cap.isOpened():
-                ret, frame = self.cap.read()
+                ret, frame = self._read_latest()
                 if ret:
                     frame_idx += 1
+                    if self._dropped and frame_idx % 300 == 0:
+                        print(f"Camera drain: dropped {self._dropped} stale frames so far")
                     yield frame_idx, frame
                     continue
                 else:
@@ -55,6 +80,36 @@ class LiveCameraSource(VideoSource):
         if self.cap:
             self.cap.release()
 
+    def _read_latest(self):
+        """
+        Drain any frames queued by the driver with cheap grab() calls and
+        decode only the newest one. A grab served from the buffer returns
+        almost instantly; a grab that blocks for a frame interval waited on
+        the sensor and fetched the newest capture. Draining skips the
+        (dominant) MJPG decode cost for every stale frame and bounds
+        latency to one frame period.
+        """
+        t0 = time.perf_counter()
+        if not self.cap.grab():
+            return False, None
+
+        if time.perf_counter() - t0 < self.FRESH_GRAB_SEC:
+            # The first grab came from the driver buffer, so the frame may
+            # be stale: drain to the newest one. When the consumer keeps
+            # pace the buffer is empty, the first grab blocks for a fresh
+            # capture and this loop never runs.
+            for _ in range(self.MAX_DRAIN):
+                t0 = time.perf_counter()
+                if not self.cap.grab():
+                    break
+                # This grab replaced the held frame, which was stale
+                self._dropped += 1
+                if time.perf_counter() - t0 > self.FRESH_GRAB_SEC:
+                    # This grab waited on the sensor: it's the newest frame
+                    break
+
+        return self.cap.retrieve()
+
     @property
     def resolution(self):
         width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -7,8 +7,19 @@ class JetsonCameraSource(VideoSource):
             f"v4l2src device={device} ! "
             f"image/jpeg, format=MJPG, width={width}, height={height}, framerate={framerate}/1 ! "
             "nvv4l2decoder mjpeg=1 ! "
+            # nvvidconv hands BGRx straight to the appsink: the old
+            # videoconvert stage only stripped the padding byte on the CPU,
+            # a full-frame memory pass at 1080p. Frames arrive as 4-channel
+            # arrays; the processor and writer ignore/strip the x channel
+            # where a 3-channel image is actually required.
             "nvvidconv ! video/x-raw, format=BGRx ! "
-            "videoconvert ! video/x-raw, format=BGR ! appsink drop=1"
+            # Leaky queue so a slow consumer sheds frames here instead of
+            # backing up the decoder
+            "queue leaky=downstream max-size-buffers=1 ! "
+            # max-buffers=1 is required for drop to mean anything (the
+            # appsink queue is unbounded by default); sync=false stops the
+            # sink from pacing an already-live source against the clock
+            "appsink drop=true max-buffers=1 sync=false"
         )
 
         self.cap = cv2.VideoCapture(self.gst_pipeline, cv2.CAP_GSTREAMER)
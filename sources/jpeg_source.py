@@ -1,7 +1,14 @@
 import os
 import cv2
+from concurrent.futures import ThreadPoolExecutor
 from .video_source import VideoSource
 
+# Optional: libjpeg-turbo bindings for SIMD-accelerated JPEG decoding
+try:
+    from turbojpeg import TurboJPEG
+except ImportError:
+    TurboJPEG = None
+
 class JpegFileSource(VideoSource):
     def __init__(self, directory_path):
         self.image_files = sorted([
@@ -9,23 +16,47 @@ class JpegFileSource(VideoSource):
             for f in os.listdir(directory_path)
             if f.lower().endswith('.jpg') or f.lower().endswith('.jpeg')
         ])
+        # Decode through libjpeg-turbo when available; fall back to cv2
+        self.tj = None
+        if TurboJPEG is not None:
+            try:
+                self.tj = TurboJPEG()
+            except Exception as e:
+                print(f"TurboJPEG unavailable, using cv2 decoder: {e}")
+
+    def _read_image(self, file_path):
+        if self.tj is not None:
+            try:
+                with open(file_path, 'rb') as f:
+                    return self.tj.decode(f.read())
+            except Exception:
+                return None
+        return cv2.imread(file_path)
 
     def frames(self):
-        for idx, file_path in enumerate(self.image_files):
-            frame = cv2.imread(file_path)
-            if frame is None:
-                continue  # Skip unreadable files
-            yield idx, frame
+        if not self.image_files:
+            return
+        # Decode one file ahead on a worker thread, so disk reads and JPEG
+        # decode overlap the consumer's inference on the previous frame
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            future = pool.submit(self._read_image, self.image_files[0])
+            for idx, file_path in enumerate(self.image_files):
+                frame = future.result()
+                if idx + 1 < len(self.image_files):
+                    future = pool.submit(self._read_image, self.image_files[idx + 1])
+                if frame is None:
+                    continue  # Skip unreadable files
+                yield idx, frame
 
     @property
     def resolution(self):
         for file_path in self.image_files:
-            frame = cv2.imread(file_path)
+            frame = self._read_image(file_path)
             if frame is not None:
                 height, width = frame.shape[:2]
                 return width, height
         raise ValueError("No readable images found to determine resolution.")
-    
+
     @property
     def fps(self):
-        return 30.0
\ No newline at end of file
+        return 30.0
@@ -0,0 +1,90 @@
+import threading
+import queue
+
+class PrefetchFrameIterator:
+    """
+    Runs a VideoSource.frames() generator on a daemon thread and hands frames
+    to the consumer, so capture/decode overlaps inference in the main loop.
+    Input-side counterpart of AsyncWriter.
+
+    With drop_stale=True (live sources) the producer writes into a single
+    lock-guarded slot, overwriting whatever the consumer hasn't taken yet:
+    capture never blocks and the consumer always gets the newest frame. A
+    Queue would make the producer block (or spin on get/put races) instead
+    of overwriting.
+
+    Without it (file sources) a small bounded queue blocks the producer, so
+    no frame is ever skipped.
+    """
+    _SENTINEL = object()
+
+    def __init__(self, source, maxsize=2, drop_stale=False):
+        self.source = source
+        self.drop_stale = drop_stale
+        self.dropped_count = 0
+        self.stopped = False
+
+        if drop_stale:
+            self._cond = threading.Condition()
+            self._slot = None
+            self._finished = False
+        else:
+            self.queue = queue.Queue(maxsize=maxsize)
+
+        self.thread = threading.Thread(target=self._producer, daemon=True)
+        self.thread.start()
+
+    def _producer(self):
+        try:
+            for item in self.source.frames():
+                if self.stopped:
+                    break
+                if self.drop_stale:
+                    # Overwrite-not-block: replace an untaken frame with the
+                    # newest capture
+                    with self._cond:
+                        if self._slot is not None:
+                            self.dropped_count += 1
+                        self._slot = item
+                        self._cond.notify()
+                else:
+                    # Blocks when the consumer falls behind, throttling capture
+                    self.queue.put(item)
+        finally:
+            if self.drop_stale:
+                with self._cond:
+                    self._finished = True
+                    self._cond.notify()
+            else:
+                self.queue.put(self._SENTINEL)
+
+    def __iter__(self):
+        if self.drop_stale:
+            while True:
+                with self._cond:
+                    while self._slot is None and not self._finished:
+                        self._cond.wait()
+                    if self._slot is None:
+                        return
+                    item, self._slot = self._slot, None
+                yield item
+        else:
+            while True:
+                item = self.queue.get()
+                if item is self._SENTINEL:
+                    return
+                yield item
+
+    def stop(self):
+        self.stopped = True
+        if self.drop_stale:
+            with self._cond:
+                self._slot = None
+                self._cond.notify()
+        else:
+            # Unblock the producer if it's waiting on a full queue
+            try:
+                while True:
+                    self.queue.get_nowait()
+            except queue.Empty:
+                pass
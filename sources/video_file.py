@@ -2,13 +2,29 @@ import cv2
 from .video_source import VideoSource
 
 class VideoFileSource(VideoSource):
-    def __init__(self, file_path):
+    def __init__(self, file_path, target_fps=None):
         self.cap = cv2.VideoCapture(file_path)
+        # When the pipeline can't keep up with high-fps material, sample
+        # down to target_fps: skipped frames are advanced with a cheap
+        # grab() and never decoded.
+        self.target_fps = target_fps
 
     def frames(self):
+        skip = 1
+        if self.target_fps:
+            source_fps = self.cap.get(cv2.CAP_PROP_FPS)
+            if source_fps and source_fps > self.target_fps:
+                skip = max(1, round(source_fps / self.target_fps))
+
         frame_idx = 0
         while self.cap.isOpened():
-            ret, frame = self.cap.read()
+            # Advance past frames we won't process; grab() skips the decode
+            for _ in range(skip - 1):
+                if not self.cap.grab():
+                    break
+            if not self.cap.grab():
+                break
+            ret, frame = self.cap.retrieve()
             if not ret:
                 break
             yield frame_idx, frame
@@ -20,8 +36,8 @@ class VideoFileSource(VideoSource):
         width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         return width, height
-    
+
     @property
     def fps(self):
         fps = self.cap.get(cv2.CAP_PROP_FPS)
-        return fps
\ No newline at end of file
+        return fps
@@ -1,22 +1,29 @@
 import threading
 import json
 import time
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 class SharedState:
+    # Snapshot JSON is memoized for this long, so a burst of pollers costs
+    # one json.dumps and the lock is only held for a reference read
+    SNAPSHOT_TTL = 0.1
+
     def __init__(self):
         self._lock = threading.Lock()
         self.fps = 0.0
         self.hands_detected = 0
         self.start_time = time.time()
         self.status = "initializing"
+        self._cached_json = None
+        self._cached_at = 0.0
 
     def update(self, fps, hands_detected):
         with self._lock:
             self.fps = fps
             self.hands_detected = hands_detected
             self.status = "running"
-    
+            self._cached_json = None
+
     def get_snapshot(self):
         with self._lock:
             return {
@@ -26,6 +33,20 @@ class SharedState:
                 "uptime_seconds": round(time.time() - self.start_time, 2)
             }
 
+    def get_snapshot_json(self):
+        """Returns the snapshot as encoded JSON bytes, memoized at ~10 Hz."""
+        now = time.time()
+        with self._lock:
+            if self._cached_json is None or now - self._cached_at > self.SNAPSHOT_TTL:
+                self._cached_json = json.dumps({
+                    "status": self.status,
+                    "current_fps": round(self.fps, 2),
+                    "hands_detected": self.hands_detected,
+                    "uptime_seconds": round(now - self.start_time, 2)
+                }).encode('utf-8')
+                self._cached_at = now
+            return self._cached_json
+
 # Global instance to be shared
 state = SharedState()
 
@@ -35,19 +56,20 @@ class TelemetryHandler(BaseHTTPRequestHandler):
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
             self.end_headers()
-            
-            data = state.get_snapshot()
-            response = json.dumps(data)
-            self.wfile.write(response.encode('utf-8'))
+
+            self.wfile.write(state.get_snapshot_json())
         else:
             self.send_error(404)
-            
+
     # Suppress default logging to keep console clean
     def log_message(self, format, *args):
         pass
 
 def start_server(port=5000):
-    server = HTTPServer(('0.0.0.0', port), TelemetryHandler)
+    # One thread per request: a slow or stalled poller can no longer block
+    # subsequent /health requests
+    server = ThreadingHTTPServer(('0.0.0.0', port), TelemetryHandler)
+    server.daemon_threads = True
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     print(f"📡 Telemetry server running on http://localhost:{port}/health")